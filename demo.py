@@ -5,15 +5,7 @@ A preview version that doesn't go full-screen for testing purposes
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import datetime
-from pathlib import Path
-
-# Import our custom widgets
-from widgets.calendar_widget import CalendarWidget
-from widgets.yankees_widget import YankeesWidget
-from widgets.shopify_widget import ShopifyWidget
-from widgets.blank_widget import BlankWidget
+import time
 
 
 class ScreenMachineDemo:
@@ -22,6 +14,9 @@ class ScreenMachineDemo:
         self.root.title("Screen Machine - Demo Mode")
         self.root.configure(bg='#2c3e50')
         
+        # Last text shown in the status bar clock
+        self._last_time = ""
+        
         # Set a reasonable size for demo (not full-screen)
         self.root.geometry("1400x900")
         self.root.resizable(True, True)
@@ -43,6 +38,11 @@ class ScreenMachineDemo:
         
     def init_widgets(self):
         """Initialize all widget windows"""
+        # Widget modules are imported here so the root window appears sooner
+        from widgets.calendar_widget import CalendarWidget
+        from widgets.yankees_widget import YankeesWidget
+        from widgets.shopify_widget import ShopifyWidget
+        
         # Calendar widget (left side, smaller)
         self.calendar_widget = CalendarWidget(self.root)
         self.calendar_widget.grid(row=0, column=0, rowspan=2, sticky='nsew', padx=5, pady=5)
@@ -58,9 +58,9 @@ class ScreenMachineDemo:
         
     def create_status_bar(self):
         """Create a status bar at the bottom"""
-        status_frame = tk.Frame(self.root, bg='#34495e', height=30)
-        status_frame.grid(row=2, column=0, columnspan=2, sticky='ew')
-        status_frame.grid_propagate(False)
+        self.root.grid_rowconfigure(2, minsize=30, weight=0)
+        status_frame = tk.Frame(self.root, bg='#34495e')
+        status_frame.grid(row=2, column=0, columnspan=2, sticky='nsew')
         
         # Current time
         self.time_label = tk.Label(status_frame, text="", bg='#34495e', fg='white', font=('Arial', 10))
@@ -75,9 +75,9 @@ class ScreenMachineDemo:
         
     def create_demo_instructions(self):
         """Create demo instructions at the top"""
-        instructions_frame = tk.Frame(self.root, bg='#e74c3c', height=40)
-        instructions_frame.grid(row=3, column=0, columnspan=2, sticky='ew')
-        instructions_frame.grid_propagate(False)
+        self.root.grid_rowconfigure(3, minsize=40, weight=0)
+        instructions_frame = tk.Frame(self.root, bg='#e74c3c')
+        instructions_frame.grid(row=3, column=0, columnspan=2, sticky='nsew')
         
         instructions_text = "DEMO MODE: This is a preview version. Use F11 for full-screen or run screen_machine.py for the full experience."
         instructions_label = tk.Label(
@@ -91,9 +91,19 @@ class ScreenMachineDemo:
         
     def update_time(self):
         """Update the time display"""
-        current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self.update_time)
+        t = time.localtime()
+        current_time = "%04d-%02d-%02d %02d:%02d:%02d" % (
+            t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec
+        )
+        
+        # Only touch the label when the displayed text actually changes
+        if current_time != self._last_time:
+            self.time_label.config(text=current_time)
+            self._last_time = current_time
+            
+        # Schedule the next tick on the next wall-clock second to avoid drift
+        delay = 1000 - int((time.time() % 1) * 1000)
+        self.root.after(delay, self.update_time)
         
     def run(self):
         """Start the application"""
@@ -104,11 +114,13 @@ class ScreenMachineDemo:
 
 
 if __name__ == "__main__":
-    print("Starting Screen Machine Demo...")
-    print("This is a preview version that doesn't go full-screen.")
-    print("Press F11 to toggle full-screen mode.")
-    print("Run 'python3 screen_machine.py' for the full experience.")
-    print()
+    print("\n".join([
+        "Starting Screen Machine Demo...",
+        "This is a preview version that doesn't go full-screen.",
+        "Press F11 to toggle full-screen mode.",
+        "Run 'python3 screen_machine.py' for the full experience.",
+        ""
+    ]))
     
     app = ScreenMachineDemo()
     app.run()
@@ -5,15 +5,7 @@ A comprehensive screen management system with multiple widget windows
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import datetime
-from pathlib import Path
-
-# Import our custom widgets
-from widgets.calendar_widget import CalendarWidget
-from widgets.yankees_widget import YankeesWidget
-from widgets.shopify_widget import ShopifyWidget
-from widgets.blank_widget import BlankWidget
+import time
 
 
 class ScreenMachine:
@@ -22,6 +14,9 @@ class ScreenMachine:
         self.root.title("Screen Machine")
         self.root.configure(bg='#2c3e50')
         
+        # Last text shown in the status bar clock
+        self._last_time = ""
+        
         # Make it full screen
         self.root.attributes('-fullscreen', True)
         self.root.attributes('-zoomed', True)  # For Windows
@@ -44,6 +39,11 @@ class ScreenMachine:
         
     def init_widgets(self):
         """Initialize all widget windows"""
+        # Widget modules are imported here so the root window appears sooner
+        from widgets.calendar_widget import CalendarWidget
+        from widgets.yankees_widget import YankeesWidget
+        from widgets.shopify_widget import ShopifyWidget
+        
         # Calendar widget (left side, smaller)
         self.calendar_widget = CalendarWidget(self.root)
         self.calendar_widget.grid(row=0, column=0, rowspan=2, sticky='nsew', padx=5, pady=5)
@@ -63,9 +63,9 @@ class ScreenMachine:
         
     def create_status_bar(self):
         """Create a status bar at the bottom"""
-        status_frame = tk.Frame(self.root, bg='#34495e', height=30)
-        status_frame.grid(row=2, column=0, columnspan=2, sticky='ew')
-        status_frame.grid_propagate(False)
+        self.root.grid_rowconfigure(2, minsize=30, weight=0)
+        status_frame = tk.Frame(self.root, bg='#34495e')
+        status_frame.grid(row=2, column=0, columnspan=2, sticky='nsew')
         
         # Current time
         self.time_label = tk.Label(status_frame, text="", bg='#34495e', fg='white', font=('Arial', 10))
@@ -80,9 +80,19 @@ class ScreenMachine:
         
     def update_time(self):
         """Update the time display"""
-        current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self.update_time)
+        t = time.localtime()
+        current_time = "%04d-%02d-%02d %02d:%02d:%02d" % (
+            t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec
+        )
+        
+        # Only touch the label when the displayed text actually changes
+        if current_time != self._last_time:
+            self.time_label.config(text=current_time)
+            self._last_time = current_time
+            
+        # Schedule the next tick on the next wall-clock second to avoid drift
+        delay = 1000 - int((time.time() % 1) * 1000)
+        self.root.after(delay, self.update_time)
         
     def toggle_fullscreen(self, event=None):
         """Toggle fullscreen mode"""
@@ -5,6 +5,37 @@ Configuration options specific to Ubuntu systems
 
 import os
 import platform
+import functools
+from collections.abc import Mapping
+
+
+@functools.lru_cache(maxsize=None)
+def _path_exists(path):
+    """Cached os.path.exists for probes whose answer won't change at runtime"""
+    return os.path.exists(path)
+
+
+class _DesktopEnvironments(Mapping):
+    """Maps desktop environment names to whether they are installed.
+
+    Session binaries are only stat()ed when a key is first looked up, so
+    importing this module doesn't touch the filesystem.
+    """
+
+    def __init__(self, session_paths):
+        self._session_paths = session_paths
+
+    def __getitem__(self, env):
+        return _path_exists(self._session_paths[env])
+
+    def __iter__(self):
+        return iter(self._session_paths)
+
+    def __len__(self):
+        return len(self._session_paths)
+
+    def __repr__(self):
+        return repr(dict(self))
 
 # Ubuntu-specific configuration
 UBUNTU_CONFIG = {
@@ -51,12 +82,12 @@ UBUNTU_CONFIG = {
     },
     
     # Ubuntu desktop environment detection
-    'desktop_environment': {
-        'gnome': os.path.exists('/usr/bin/gnome-session'),
-        'kde': os.path.exists('/usr/bin/startkde'),
-        'xfce': os.path.exists('/usr/bin/xfce4-session'),
-        'lxde': os.path.exists('/usr/bin/lxsession'),
-    }
+    'desktop_environment': _DesktopEnvironments({
+        'gnome': '/usr/bin/gnome-session',
+        'kde': '/usr/bin/startkde',
+        'xfce': '/usr/bin/xfce4-session',
+        'lxde': '/usr/bin/lxsession',
+    })
 }
 
 # System information
@@ -77,15 +108,17 @@ def get_system_info():
     """Get system information"""
     return SYSTEM_INFO
 
+@functools.lru_cache(maxsize=1)
 def is_ubuntu():
     """Check if running on Ubuntu"""
     try:
-        with open('/etc/os-release', 'r') as f:
-            content = f.read().lower()
-            return 'ubuntu' in content
+        with open('/etc/os-release', 'rb') as f:
+            # The ID/NAME fields live at the top of the file
+            return b'ubuntu' in f.read(4096).lower()
     except:
         return False
 
+@functools.lru_cache(maxsize=1)
 def get_desktop_environment():
     """Get current desktop environment"""
     de = UBUNTU_CONFIG['desktop_environment']
@@ -109,39 +142,49 @@ def get_display_info():
 # Configuration validation
 def validate_config():
     """Validate Ubuntu configuration"""
+    return list(_validate_config())
+
+@functools.lru_cache(maxsize=1)
+def _validate_config():
+    """Run the validation checks once and cache the resulting issues"""
     issues = []
     
     if not is_ubuntu():
         issues.append("Not running on Ubuntu - some features may not work")
     
-    if not os.path.exists('/usr/bin/python3'):
+    if not _path_exists('/usr/bin/python3'):
         issues.append("Python 3 not found - install with: sudo apt install python3")
     
-    if not os.path.exists('/usr/bin/python3-tk'):
+    if not _path_exists('/usr/bin/python3-tk'):
         issues.append("tkinter not found - install with: sudo apt install python3-tk")
     
-    return issues
+    return tuple(issues)
 
 if __name__ == "__main__":
-    print("Ubuntu Configuration for Screen Machine")
-    print("=" * 40)
-    
-    print(f"OS: {SYSTEM_INFO['os']}")
-    print(f"Python: {SYSTEM_INFO['python_version']}")
-    print(f"Architecture: {SYSTEM_INFO['architecture']}")
-    print(f"Ubuntu: {is_ubuntu()}")
-    print(f"Desktop Environment: {get_desktop_environment()}")
+    # Collect the report and write it out in one go
+    report = [
+        "Ubuntu Configuration for Screen Machine",
+        "=" * 40,
+        f"OS: {SYSTEM_INFO['os']}",
+        f"Python: {SYSTEM_INFO['python_version']}",
+        f"Architecture: {SYSTEM_INFO['architecture']}",
+        f"Ubuntu: {is_ubuntu()}",
+        f"Desktop Environment: {get_desktop_environment()}",
+    ]
     
     display_info = get_display_info()
-    print(f"Display: {display_info['display']}")
-    print(f"Wayland: {display_info['wayland']}")
-    print(f"X11: {display_info['x11']}")
-    print(f"Remote: {display_info['remote']}")
+    report += [
+        f"Display: {display_info['display']}",
+        f"Wayland: {display_info['wayland']}",
+        f"X11: {display_info['x11']}",
+        f"Remote: {display_info['remote']}",
+    ]
     
-    print("\nConfiguration Validation:")
+    report.append("\nConfiguration Validation:")
     issues = validate_config()
     if issues:
-        for issue in issues:
-            print(f"⚠️  {issue}")
+        report += [f"⚠️  {issue}" for issue in issues]
     else:
-        print("✓ Configuration looks good!")
+        report.append("✓ Configuration looks good!")
+    
+    print("\n".join(report))
@@ -5,13 +5,26 @@ This script sends Wake-on-LAN packets to wake up a remote mini PC.
 """
 
 import socket
-import struct
 import argparse
+import functools
 import time
 import sys
 from typing import Optional
 
 
+# Separators accepted in MAC addresses, stripped in a single pass
+_MAC_STRIP = str.maketrans('', '', ':-')
+
+# Every magic packet starts with 6 bytes of 0xFF
+_MAGIC_PREFIX = b'\xff' * 6
+
+
+@functools.lru_cache(maxsize=32)
+def _build_packet(mac_clean: str) -> bytes:
+    """Build the magic packet for an already-normalized 12 character MAC address."""
+    return _MAGIC_PREFIX + bytes.fromhex(mac_clean) * 16
+
+
 class WakeOnLAN:
     def __init__(self):
         self.broadcast_address = '<broadcast>'
@@ -28,16 +41,14 @@ class WakeOnLAN:
             Magic packet as bytes
         """
         # Remove any separators and convert to uppercase
-        mac_address = mac_address.replace(':', '').replace('-', '').upper()
+        mac_address = mac_address.translate(_MAC_STRIP).upper()
         
         if len(mac_address) != 12:
             raise ValueError("MAC address must be 12 characters long")
         
         # Create the magic packet
         # 6 bytes of 0xFF followed by 16 repetitions of the MAC address
-        magic_packet = b'\xff' * 6 + bytes.fromhex(mac_address) * 16
-        
-        return magic_packet
+        return _build_packet(mac_address)
     
     def send_magic_packet(self, mac_address: str, broadcast_address: Optional[str] = None) -> bool:
         """
@@ -53,22 +64,58 @@ class WakeOnLAN:
         try:
             # Create the magic packet
             magic_packet = self.create_magic_packet(mac_address)
+        except Exception as e:
+            print(f"Error sending Wake-on-LAN packet: {e}")
+            return False
+        
+        return self._send_prebuilt(magic_packet, broadcast_address)
+    
+    def _open_socket(self) -> socket.socket:
+        """Create a UDP socket configured for broadcasting magic packets."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        return sock
+    
+    def _sendto(self, sock: socket.socket, magic_packet: bytes,
+                broadcast_address: Optional[str] = None) -> bool:
+        """
+        Send an already-built magic packet over an open socket.
+        
+        Args:
+            sock: Socket returned by _open_socket
+            magic_packet: Packet returned by create_magic_packet
+            broadcast_address: Broadcast address (optional, defaults to '<broadcast>')
             
-            # Create UDP socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            
-            # Send the packet
+        Returns:
+            True if packet was sent successfully, False otherwise
+        """
+        try:
             target_address = broadcast_address or self.broadcast_address
             sock.sendto(magic_packet, (target_address, self.port))
-            sock.close()
-            
             return True
             
         except Exception as e:
             print(f"Error sending Wake-on-LAN packet: {e}")
             return False
     
+    def _send_prebuilt(self, magic_packet: bytes, broadcast_address: Optional[str] = None) -> bool:
+        """
+        Send an already-built magic packet on a one-shot socket.
+        
+        Args:
+            magic_packet: Packet returned by create_magic_packet
+            broadcast_address: Broadcast address (optional, defaults to '<broadcast>')
+            
+        Returns:
+            True if packet was sent successfully, False otherwise
+        """
+        try:
+            with self._open_socket() as sock:
+                return self._sendto(sock, magic_packet, broadcast_address)
+        except Exception as e:
+            print(f"Error sending Wake-on-LAN packet: {e}")
+            return False
+    
     def wake_device(self, mac_address: str, retries: int = 3, delay: float = 1.0) -> bool:
         """
         Wake up a device with retry logic.
@@ -83,19 +130,32 @@ class WakeOnLAN:
         """
         print(f"Attempting to wake up device with MAC address: {mac_address}")
         
+        # Build the packet once; every retry sends the same bytes
+        try:
+            magic_packet = self.create_magic_packet(mac_address)
+        except Exception as e:
+            print(f"Error sending Wake-on-LAN packet: {e}")
+            print("Failed to send Wake-on-LAN packet after all attempts.")
+            return False
+        
         success = False
-        for attempt in range(1, retries + 1):
-            print(f"Attempt {attempt}/{retries}...")
-            
-            if self.send_magic_packet(mac_address):
-                success = True
-                print(f"Wake-on-LAN packet sent successfully (attempt {attempt})")
-            else:
-                print(f"Failed to send Wake-on-LAN packet (attempt {attempt})")
-            
-            if attempt < retries:
-                print(f"Waiting {delay} seconds before next attempt...")
-                time.sleep(delay)
+        try:
+            # One socket serves every retry
+            with self._open_socket() as sock:
+                for attempt in range(1, retries + 1):
+                    print(f"Attempt {attempt}/{retries}...")
+                    
+                    if self._sendto(sock, magic_packet):
+                        success = True
+                        print(f"Wake-on-LAN packet sent successfully (attempt {attempt})")
+                    else:
+                        print(f"Failed to send Wake-on-LAN packet (attempt {attempt})")
+                    
+                    if attempt < retries:
+                        print(f"Waiting {delay} seconds before next attempt...")
+                        time.sleep(delay)
+        except Exception as e:
+            print(f"Error sending Wake-on-LAN packet: {e}")
         
         if success:
             print("Wake-on-LAN sequence completed successfully!")
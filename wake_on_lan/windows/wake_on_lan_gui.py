@@ -5,13 +5,32 @@ This script provides a simple GUI interface to wake up a remote mini PC.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox
+import ast
 import json
 import os
-import sys
 from wake_on_lan import WakeOnLAN
 
 
+# Constants read from config.py
+CONFIG_CONSTANTS = ('UBUNTU_MINI_PC', 'WOL_SETTINGS')
+
+
+def _read_config_constants(config_path):
+    """Extract the literal constants we need from config.py without executing it."""
+    # Read bytes so ast.parse decodes as UTF-8 or per the file's coding cookie, like the import system
+    with open(config_path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=config_path)
+    
+    found = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id in CONFIG_CONSTANTS):
+            found[node.targets[0].id] = ast.literal_eval(node.value)
+    return found
+
+
 class WakeOnLANGUI:
     def __init__(self, root):
         self.root = root
@@ -28,6 +47,10 @@ class WakeOnLANGUI:
         
         self.setup_ui()
         
+        # Pending wake retries, if any (see wake_device)
+        self._retry_state = None
+        self.root.bind('<Destroy>', self._on_destroy, add='+')
+        
     def load_config(self):
         """Load configuration from file."""
         self.config = {
@@ -42,19 +65,16 @@ class WakeOnLANGUI:
             # Check if config.py exists in the same directory
             config_path = os.path.join(os.path.dirname(__file__), '..', 'config.py')
             if os.path.exists(config_path):
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("config", config_path)
-                config_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(config_module)
+                constants = _read_config_constants(config_path)
                 
                 # Load values from config.py
-                if hasattr(config_module, 'UBUNTU_MINI_PC'):
-                    ubuntu_config = config_module.UBUNTU_MINI_PC
+                if 'UBUNTU_MINI_PC' in constants:
+                    ubuntu_config = constants['UBUNTU_MINI_PC']
                     self.config["mac_address"] = ubuntu_config.get("mac_address", "")
                     self.config["device_name"] = ubuntu_config.get("name", "")
                 
-                if hasattr(config_module, 'WOL_SETTINGS'):
-                    wol_settings = config_module.WOL_SETTINGS
+                if 'WOL_SETTINGS' in constants:
+                    wol_settings = constants['WOL_SETTINGS']
                     self.config["retries"] = wol_settings.get("retries", 3)
                     self.config["delay"] = wol_settings.get("delay", 1.0)
                     
@@ -93,40 +113,43 @@ class WakeOnLANGUI:
         subtitle_label = ttk.Label(main_frame, text="Wake-on-LAN Utility (Windows → Ubuntu)", font=("Arial", 12))
         subtitle_label.grid(row=1, column=0, columnspan=2, pady=(0, 20))
         
-        # Device name
-        ttk.Label(main_frame, text="Device Name:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        # Input variables
         self.device_name_var = tk.StringVar(value=self.config["device_name"])
-        device_name_entry = ttk.Entry(main_frame, textvariable=self.device_name_var, width=30)
-        device_name_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
-        
-        # Help text for device name
-        device_help = ttk.Label(main_frame, text="e.g., Ubuntu Mini PC, TV Computer", 
-                               font=("Arial", 8), foreground="gray")
-        device_help.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
-        
-        # MAC address
-        ttk.Label(main_frame, text="MAC Address:").grid(row=4, column=0, sticky=tk.W, pady=5)
         self.mac_address_var = tk.StringVar(value=self.config["mac_address"])
-        mac_address_entry = ttk.Entry(main_frame, textvariable=self.mac_address_var, width=30)
-        mac_address_entry.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
+        self.retries_var = tk.IntVar(value=self.config["retries"])
+        self.delay_var = tk.DoubleVar(value=self.config["delay"])
         
-        # Help text for MAC address format
-        help_text = ttk.Label(main_frame, text="Format: XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX", 
-                             font=("Arial", 8), foreground="gray")
-        help_text.grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(0, 10))
+        # Form rows: (label, input widget, input sticky, help text, help padding)
+        form_rows = (
+            ("Device Name:",
+             ttk.Entry(main_frame, textvariable=self.device_name_var, width=30),
+             (tk.W, tk.E), "e.g., Ubuntu Mini PC, TV Computer", (0, 5)),
+            ("MAC Address:",
+             ttk.Entry(main_frame, textvariable=self.mac_address_var, width=30),
+             (tk.W, tk.E), "Format: XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX", (0, 10)),
+            ("Retries:",
+             ttk.Spinbox(main_frame, from_=1, to=10, textvariable=self.retries_var, width=10),
+             tk.W, None, None),
+            ("Delay (seconds):",
+             ttk.Spinbox(main_frame, from_=0.5, to=5.0, increment=0.5,
+                         textvariable=self.delay_var, width=10),
+             tk.W, None, None),
+        )
         
-        # Retries
-        ttk.Label(main_frame, text="Retries:").grid(row=6, column=0, sticky=tk.W, pady=5)
-        self.retries_var = tk.IntVar(value=self.config["retries"])
-        retries_spinbox = ttk.Spinbox(main_frame, from_=1, to=10, textvariable=self.retries_var, width=10)
-        retries_spinbox.grid(row=6, column=1, sticky=tk.W, pady=5, padx=(10, 0))
+        # Lay out the form in a single pass
+        row = 2
+        for label_text, input_widget, sticky, help_text, help_pady in form_rows:
+            ttk.Label(main_frame, text=label_text).grid(row=row, column=0, sticky=tk.W, pady=5)
+            input_widget.grid(row=row, column=1, sticky=sticky, pady=5, padx=(10, 0))
+            row += 1
+            
+            if help_text:
+                ttk.Label(main_frame, text=help_text, font=("Arial", 8), foreground="gray").grid(
+                    row=row, column=0, columnspan=2, sticky=tk.W, pady=help_pady)
+                row += 1
         
-        # Delay
-        ttk.Label(main_frame, text="Delay (seconds):").grid(row=7, column=0, sticky=tk.W, pady=5)
-        self.delay_var = tk.DoubleVar(value=self.config["delay"])
-        delay_spinbox = ttk.Spinbox(main_frame, from_=0.5, to=5.0, increment=0.5, 
-                                   textvariable=self.delay_var, width=10)
-        delay_spinbox.grid(row=7, column=1, sticky=tk.W, pady=5, padx=(10, 0))
+        # Let the input column take any spare width
+        main_frame.grid_columnconfigure(1, weight=1)
         
         # Buttons frame
         button_frame = ttk.Frame(main_frame)
@@ -189,33 +212,74 @@ class WakeOnLANGUI:
         self.status_var.set("Waking up device...")
         self.progress.start()
         
-        # Run the wake operation in a separate thread to avoid blocking the GUI
-        self.root.after(100, self._wake_device_async, mac_address, device_name)
-    
-    def _wake_device_async(self, mac_address, device_name):
-        """Wake device asynchronously."""
+        # Send one packet per Tk callback so the GUI stays responsive between retries
+        self._retry_state = None
         try:
-            retries = self.retries_var.get()
-            delay = self.delay_var.get()
-            
-            success = self.wol.wake_device(mac_address, retries, delay)
-            
-            if success:
-                device_display = device_name if device_name else mac_address
-                self.status_var.set(f"Successfully sent wake signal to {device_display}")
-                messagebox.showinfo("Success", f"Wake-on-LAN packet sent successfully to {device_display}")
-            else:
-                self.status_var.set("Failed to wake up device")
-                messagebox.showerror("Error", "Failed to send Wake-on-LAN packet")
-                
+            packet = self.wol.create_magic_packet(mac_address)
+            self._retry_state = {
+                'remaining': self.retries_var.get(),
+                'delay_ms': int(self.delay_var.get() * 1000),
+                'mac': mac_address,
+                'name': device_name,
+                'success': False,
+                'sock': self.wol._open_socket(),
+                'packet': packet,
+                'job': None
+            }
         except Exception as e:
-            self.status_var.set(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            self._finish_wake(error=e)
+            return
+        
+        self._retry_state['job'] = self.root.after(0, self._next_retry)
+    
+    def _next_retry(self):
+        """Send a single wake packet and schedule the next attempt."""
+        state = self._retry_state
+        state['job'] = None
+        if state['remaining'] <= 0:
+            self._finish_wake()
+            return
+        
+        if self.wol._sendto(state['sock'], state['packet']):
+            state['success'] = True
+        state['remaining'] -= 1
+        
+        if state['remaining'] > 0:
+            state['job'] = self.root.after(state['delay_ms'], self._next_retry)
+        else:
+            self._finish_wake()
+    
+    def _on_destroy(self, event):
+        """Cancel pending retries and close their socket when the window goes away."""
+        if event.widget is not self.root or self._retry_state is None:
+            return
+        state = self._retry_state
+        self._retry_state = None
+        if state['job'] is not None:
+            self.root.after_cancel(state['job'])
+        state['sock'].close()
+    
+    def _finish_wake(self, error=None):
+        """Close the socket, restore the UI and report the result."""
+        state = self._retry_state
+        self._retry_state = None
+        if state is not None:
+            state['sock'].close()
+        
+        # Re-enable button and stop progress
+        self.wake_button.config(state='normal')
+        self.progress.stop()
         
-        finally:
-            # Re-enable button and stop progress
-            self.wake_button.config(state='normal')
-            self.progress.stop()
+        if error is not None:
+            self.status_var.set(f"Error: {str(error)}")
+            messagebox.showerror("Error", f"An error occurred: {str(error)}")
+        elif state['success']:
+            device_display = state['name'] if state['name'] else state['mac']
+            self.status_var.set(f"Successfully sent wake signal to {device_display}")
+            messagebox.showinfo("Success", f"Wake-on-LAN packet sent successfully to {device_display}")
+        else:
+            self.status_var.set("Failed to wake up device")
+            messagebox.showerror("Error", "Failed to send Wake-on-LAN packet")
 
 
 def main():
@@ -3,42 +3,92 @@ Base Widget Class for Screen Machine
 Provides consistent styling and behavior for all widgets
 """
 
-import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 
 
-class BaseWidget(tk.Frame):
+class BaseWidget(ttk.LabelFrame):
+    STYLE = 'Machine.TLabelframe'
+    TREEVIEW_STYLE = 'Machine.Treeview'
+    
+    # Named fonts shared by every widget: name -> (size, weight)
+    FONTS = {
+        'sm.normal9': (9, 'normal'),
+        'sm.bold9': (9, 'bold'),
+        'sm.normal10': (10, 'normal'),
+        'sm.bold10': (10, 'bold'),
+        'sm.normal11': (11, 'normal'),
+        'sm.bold11': (11, 'bold'),
+        'sm.bold12': (12, 'bold'),
+        'sm.bold14': (14, 'bold'),
+        'sm.bold16': (16, 'bold')
+    }
+    
     def __init__(self, parent, title="Widget", **kwargs):
-        super().__init__(parent, **kwargs)
+        self.configure_style(parent)
+        super().__init__(parent, text=title, style=self.STYLE, padding=5, **kwargs)
         
-        # Configure the frame
-        self.configure(
-            bg='#34495e',
+        # The labelled frame provides the title, so content goes straight into it
+        self.content_frame = self
+        
+        # Widget content is built the first time the panel is shown
+        self._content_ready = False
+        self.bind('<Map>', self._maybe_init_content, add='+')
+        
+    def _maybe_init_content(self, event=None):
+        """Initialize widget content on first map"""
+        if self._content_ready:
+            return
+        self._content_ready = True
+        self.init_content()
+        
+    @classmethod
+    def configure_style(cls, master):
+        """Configure the shared panel style (only runs once per Tk root)"""
+        # Styles and named fonts belong to the Tk interpreter, so the guard lives on its root
+        root = master._root()
+        if getattr(root, '_machine_style_configured', False):
+            return
+        
+        # Create the named fonts once; widgets then refer to them by name.
+        # References are kept on the root because Tk deletes a named font when its Font object is collected.
+        existing = set(tkfont.names(root))
+        root._machine_fonts = [
+            tkfont.Font(root, name=name, family='Arial', size=size, weight=weight)
+            for name, (size, weight) in cls.FONTS.items()
+            if name not in existing
+        ]
+        
+        style = ttk.Style(root)
+        style.configure(
+            cls.STYLE,
+            background='#34495e',
             relief='raised',
             borderwidth=2
         )
-        
-        # Create title bar
-        self.title_bar = tk.Frame(self, bg='#2c3e50', height=40)
-        self.title_bar.pack(fill='x', padx=2, pady=2)
-        self.title_bar.pack_propagate(False)
-        
-        # Title label
-        self.title_label = tk.Label(
-            self.title_bar,
-            text=title,
-            bg='#2c3e50',
-            fg='white',
-            font=('Arial', 12, 'bold')
+        style.configure(
+            cls.STYLE + '.Label',
+            background='#34495e',
+            foreground='white',
+            font='sm.bold12'
         )
-        self.title_label.pack(side='left', padx=10, pady=8)
-        
-        # Content area
-        self.content_frame = tk.Frame(self, bg='#34495e')
-        self.content_frame.pack(fill='both', expand=True, padx=5, pady=5)
         
-        # Initialize widget content
-        self.init_content()
+        # Tabular lists inside panels
+        style.configure(
+            cls.TREEVIEW_STYLE,
+            background='#2c3e50',
+            fieldbackground='#2c3e50',
+            foreground='white',
+            font='sm.normal10',
+            rowheight=24
+        )
+        style.configure(
+            cls.TREEVIEW_STYLE + '.Heading',
+            background='#34495e',
+            foreground='white',
+            font='sm.bold9'
+        )
+        root._machine_style_configured = True
         
     def init_content(self):
         """Override this method in subclasses to add widget-specific content"""
@@ -4,14 +4,32 @@ Placeholder widget for future functionality
 """
 
 import tkinter as tk
-from tkinter import ttk
 from .base_widget import BaseWidget
 
 
+# Help text shown in the customization dialog
+_CUSTOMIZATION_INFO = """This widget can be customized for various purposes:
+
+• Weather information display
+• News and RSS feeds
+• System monitoring and alerts
+• Social media feeds
+• Stock market data
+• Custom business metrics
+• Integration with other APIs
+• Real-time data streams
+
+To customize, modify the blank_widget.py file
+or create a new widget class."""
+
+
 class BlankWidget(BaseWidget):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, title="🔲 Blank Space", **kwargs)
         
+        # Customization dialog, built on first use and reused afterwards
+        self._info_dialog = None
+        
     def init_content(self):
         """Initialize blank widget content"""
         # Main content area
@@ -24,7 +42,7 @@ class BlankWidget(BaseWidget):
             text="Future Widget Space",
             bg='#34495e',
             fg='#95a5a6',
-            font=('Arial', 16, 'bold')
+            font='sm.bold16'
         )
         welcome_label.pack(pady=(50, 20))
         
@@ -34,7 +52,7 @@ class BlankWidget(BaseWidget):
             text="This space is reserved for future functionality.\n\nPossible uses:\n• Weather widget\n• News feed\n• System monitoring\n• Custom integrations\n• Additional business tools",
             bg='#34495e',
             fg='#7f8c8d',
-            font=('Arial', 11),
+            font='sm.normal11',
             justify='center'
         )
         desc_label.pack(pady=20)
@@ -46,7 +64,7 @@ class BlankWidget(BaseWidget):
             command=self.show_customization_info,
             bg='#3498db',
             fg='white',
-            font=('Arial', 10, 'bold'),
+            font='sm.bold10',
             relief='flat',
             padx=20,
             pady=10
@@ -62,36 +80,36 @@ class BlankWidget(BaseWidget):
             text="Status: Ready for customization",
             bg='#34495e',
             fg='#27ae60',
-            font=('Arial', 9)
+            font='sm.normal9'
         )
         status_label.pack()
         
     def show_customization_info(self):
         """Show information about customizing this widget"""
-        info_text = """This widget can be customized for various purposes:
-
-• Weather information display
-• News and RSS feeds
-• System monitoring and alerts
-• Social media feeds
-• Stock market data
-• Custom business metrics
-• Integration with other APIs
-• Real-time data streams
-
-To customize, modify the blank_widget.py file
-or create a new widget class."""
+        if self._info_dialog is None or not self._info_dialog.winfo_exists():
+            self._info_dialog = self._build_info_dialog()
         
+        # Position the dialog near the widget and make it modal
+        dialog = self._info_dialog
+        dialog.geometry("+%d+%d" % (self.winfo_rootx() + 50, self.winfo_rooty() + 50))
+        dialog.deiconify()
+        dialog.grab_set()
+        
+    def _hide_info_dialog(self):
+        """Hide the customization dialog so it can be shown again"""
+        self._info_dialog.grab_release()
+        self._info_dialog.withdraw()
+        
+    def _build_info_dialog(self):
+        """Create the (initially hidden) customization dialog"""
         # Create a simple info dialog
         dialog = tk.Toplevel(self)
+        dialog.withdraw()
         dialog.title("Widget Customization")
         dialog.geometry("500x400")
         dialog.configure(bg='#2c3e50')
         dialog.transient(self)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.geometry("+%d+%d" % (self.winfo_rootx() + 50, self.winfo_rooty() + 50))
+        dialog.protocol('WM_DELETE_WINDOW', self._hide_info_dialog)
         
         # Content
         title_label = tk.Label(
@@ -99,7 +117,7 @@ or create a new widget class."""
             text="Widget Customization Options",
             bg='#2c3e50',
             fg='white',
-            font=('Arial', 14, 'bold')
+            font='sm.bold14'
         )
         title_label.pack(pady=20)
         
@@ -107,7 +125,7 @@ or create a new widget class."""
             dialog,
             bg='#34495e',
             fg='white',
-            font=('Arial', 10),
+            font='sm.normal10',
             wrap='word',
             height=15,
             relief='flat',
@@ -115,23 +133,25 @@ or create a new widget class."""
             pady=15
         )
         text_widget.pack(fill='both', expand=True, padx=20, pady=(0, 20))
-        text_widget.insert('1.0', info_text)
+        text_widget.insert('1.0', _CUSTOMIZATION_INFO)
         text_widget.config(state='disabled')
         
         # Close button
         close_btn = tk.Button(
             dialog,
             text="Close",
-            command=dialog.destroy,
+            command=self._hide_info_dialog,
             bg='#e74c3c',
             fg='white',
-            font=('Arial', 10, 'bold'),
+            font='sm.bold10',
             relief='flat',
             padx=20,
             pady=5
         )
         close_btn.pack(pady=(0, 20))
         
+        return dialog
+        
     def refresh(self):
         """Refresh widget data (placeholder for future functionality)"""
         # This method can be overridden when the widget is customized
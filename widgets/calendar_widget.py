@@ -5,13 +5,36 @@ Designed for easy Google Calendar API integration
 """
 
 import tkinter as tk
-from tkinter import ttk
 import calendar
 import datetime
 from .base_widget import BaseWidget
 
 
+# Month names indexed 1-12, resolved once instead of on every lookup
+_MONTH_NAMES = tuple(calendar.month_name)
+
+# calendar.monthcalendar results keyed by (year, month); they never change
+_MONTHCAL_CACHE = {}
+
+
+def _get_monthcal(year, month):
+    """Return the (cached) week rows for a month"""
+    weeks = _MONTHCAL_CACHE.get((year, month))
+    if weeks is None:
+        weeks = calendar.monthcalendar(year, month)
+        _MONTHCAL_CACHE[(year, month)] = weeks
+    return weeks
+
+
 class CalendarWidget(BaseWidget):
+    # Day cell background keyed by (is_today, has_events); today wins over events
+    DAY_COLORS = {
+        (False, False): '#34495e',
+        (False, True): '#e74c3c',
+        (True, False): '#f39c12',
+        (True, True): '#f39c12'
+    }
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, title="📅 Calendar", **kwargs)
         
@@ -31,6 +54,17 @@ class CalendarWidget(BaseWidget):
             (2025, 1, 28): "System Maintenance - 11:00 PM",
             (2025, 1, 30): "Monthly Report Due",
         }
+        self.mock_events = self._normalize_events(self.mock_events)
+        
+        # Day events dialog, built on first use and reused afterwards
+        self._day_dialog = None
+        
+        # Days of the displayed month that have events
+        self._event_days_this_month = set()
+        self._rebuild_event_index()
+        
+        # Pending month-navigation redraw (coalesces rapid clicks)
+        self._redraw_job = None
         
         # Create calendar display
         self.create_calendar_display()
@@ -51,7 +85,7 @@ class CalendarWidget(BaseWidget):
             command=self.previous_month,
             bg='#3498db',
             fg='white',
-            font=('Arial', 10, 'bold'),
+            font='sm.bold10',
             relief='flat'
         )
         self.prev_btn.pack(side='left', padx=5)
@@ -62,7 +96,7 @@ class CalendarWidget(BaseWidget):
             text="",
             bg='#34495e',
             fg='white',
-            font=('Arial', 14, 'bold')
+            font='sm.bold14'
         )
         self.month_label.pack(side='left', expand=True)
         
@@ -73,7 +107,7 @@ class CalendarWidget(BaseWidget):
             command=self.next_month,
             bg='#3498db',
             fg='white',
-            font=('Arial', 10, 'bold'),
+            font='sm.bold10',
             relief='flat'
         )
         self.next_btn.pack(side='right', padx=5)
@@ -90,7 +124,7 @@ class CalendarWidget(BaseWidget):
                 text=day,
                 bg='#2c3e50',
                 fg='white',
-                font=('Arial', 10, 'bold'),
+                font='sm.bold10',
                 width=8,
                 height=2
             )
@@ -100,56 +134,74 @@ class CalendarWidget(BaseWidget):
         for i in range(7):
             self.calendar_frame.grid_columnconfigure(i, weight=1)
         
+        # Day cells are created once (6 weeks x 7 days) and reconfigured per month
+        self.day_cells = []
+        for week_num in range(6):
+            week_cells = []
+            for day_num in range(7):
+                day_label = tk.Label(
+                    self.calendar_frame,
+                    text="",
+                    bg='#34495e',
+                    fg='white',
+                    font='sm.bold10',
+                    width=8,
+                    height=2,
+                    relief='flat'
+                )
+                day_label.grid(row=week_num + 1, column=day_num, sticky='nsew', padx=1, pady=1)
+                day_label.day = None
+                # Bound once; the handler reads the day the cell currently shows
+                day_label.bind('<Button-1>', self._on_day_click)
+                week_cells.append(day_label)
+            self.day_cells.append(week_cells)
+        
         # Update calendar display
         self.update_calendar_display()
         
+    def update_month_label(self):
+        """Update the month/year label"""
+        month_name = _MONTH_NAMES[self.current_month]
+        self.month_label.config(text=f"{month_name} {self.current_year}")
+        
     def update_calendar_display(self):
         """Update the calendar display for current month/year"""
         # Update month label
-        month_name = calendar.month_name[self.current_month]
-        self.month_label.config(text=f"{month_name} {self.current_year}")
-        
-        # Clear existing calendar days
-        for widget in self.calendar_frame.winfo_children():
-            if isinstance(widget, tk.Label) and widget.grid_info()['row'] > 0:
-                widget.destroy()
+        self.update_month_label()
         
         # Get calendar data
-        cal = calendar.monthcalendar(self.current_year, self.current_month)
-        
-        # Create day labels
-        for week_num, week in enumerate(cal):
-            for day_num, day in enumerate(week):
-                if day != 0:
-                    # Check if this day has events
-                    has_events = (self.current_year, self.current_month, day) in self.mock_events
-                    
-                    # Create day label
-                    day_label = tk.Label(
-                        self.calendar_frame,
-                        text=str(day),
-                        bg='#e74c3c' if has_events else '#34495e',
-                        fg='white',
-                        font=('Arial', 10, 'bold'),
-                        width=8,
-                        height=2,
-                        relief='flat'
-                    )
-                    day_label.grid(row=week_num + 1, column=day_num, sticky='nsew', padx=1, pady=1)
-                    
-                    # Highlight today
-                    if (day == self.current_date.day and 
-                        self.current_month == self.current_date.month and 
-                        self.current_year == self.current_date.year):
-                        day_label.config(bg='#f39c12')
-                        
-                    # Bind click event to show events
-                    day_label.bind('<Button-1>', lambda e, d=day: self.show_day_events(d))
-        
-        # Configure row weights
-        for i in range(1, len(cal) + 1):
-            self.calendar_frame.grid_rowconfigure(i, weight=1)
+        cal = _get_monthcal(self.current_year, self.current_month)
+        
+        is_current_month = (self.current_month == self.current_date.month and
+                            self.current_year == self.current_date.year)
+        
+        # Reconfigure the day cells in place
+        for week_num, week_cells in enumerate(self.day_cells):
+            week = cal[week_num] if week_num < len(cal) else (0,) * 7
+            for day_num, day_label in enumerate(week_cells):
+                day = week[day_num]
+                if day == 0:
+                    day_label.day = None
+                    day_label.grid_remove()
+                    continue
+                
+                # Check if this day has events / is today
+                has_events = day in self._event_days_this_month
+                is_today = is_current_month and day == self.current_date.day
+                
+                day_label.day = day
+                day_label.config(text=str(day), bg=self.DAY_COLORS[is_today, has_events])
+                day_label.grid()
+        
+        # Configure row weights (unused trailing weeks collapse)
+        for i in range(1, len(self.day_cells) + 1):
+            self.calendar_frame.grid_rowconfigure(i, weight=1 if i <= len(cal) else 0)
             
+    def _on_day_click(self, event):
+        """Show events for the clicked day cell"""
+        if event.widget.day is not None:
+            self.show_day_events(event.widget.day)
+        
     def create_events_list(self):
         """Create the events list below calendar"""
         # Events header
@@ -158,7 +210,7 @@ class CalendarWidget(BaseWidget):
             text="Today's Events:",
             bg='#34495e',
             fg='white',
-            font=('Arial', 11, 'bold'),
+            font='sm.bold11',
             anchor='w'
         )
         events_header.pack(fill='x', pady=(10, 5))
@@ -168,7 +220,7 @@ class CalendarWidget(BaseWidget):
             self.content_frame,
             bg='#2c3e50',
             fg='white',
-            font=('Arial', 9),
+            font='sm.normal9',
             height=4,
             relief='flat',
             selectmode='none'
@@ -184,18 +236,87 @@ class CalendarWidget(BaseWidget):
         
         today = (self.current_date.year, self.current_date.month, self.current_date.day)
         if today in self.mock_events:
-            self.events_listbox.insert(tk.END, self.mock_events[today])
+            self.events_listbox.insert(tk.END, *self.mock_events[today])
         else:
             self.events_listbox.insert(tk.END, "No events scheduled")
             
+    @staticmethod
+    def _normalize_events(events):
+        """Make every event entry a list of descriptions"""
+        return {
+            date: [entry] if isinstance(entry, str) else list(entry)
+            for date, entry in events.items()
+        }
+        
     def show_day_events(self, day):
         """Show events for a specific day"""
         events = self.mock_events.get((self.current_year, self.current_month, day), [])
-        if events:
-            messagebox.showinfo(f"Events for {day}", events)
-        else:
-            messagebox.showinfo(f"Events for {day}", "No events scheduled")
+        
+        if self._day_dialog is None or not self._day_dialog.winfo_exists():
+            self._day_dialog = self._build_day_dialog()
             
+        self._day_dialog.title(f"Events for {day}")
+        self._day_dialog_text.set("\n".join(events) if events else "No events scheduled")
+        self._day_dialog.deiconify()
+        self._day_dialog.lift()
+        
+    def _build_day_dialog(self):
+        """Create the (initially hidden) day events dialog"""
+        dialog = tk.Toplevel(self)
+        dialog.withdraw()
+        dialog.configure(bg='#2c3e50')
+        dialog.transient(self)
+        dialog.resizable(False, False)
+        dialog.protocol('WM_DELETE_WINDOW', dialog.withdraw)
+        
+        self._day_dialog_text = tk.StringVar(self)
+        events_label = tk.Label(
+            dialog,
+            textvariable=self._day_dialog_text,
+            bg='#2c3e50',
+            fg='white',
+            font='sm.normal10',
+            justify='left'
+        )
+        events_label.pack(padx=20, pady=(20, 10))
+        
+        # Close button
+        close_btn = tk.Button(
+            dialog,
+            text="Close",
+            command=dialog.withdraw,
+            bg='#3498db',
+            fg='white',
+            font='sm.bold10',
+            relief='flat',
+            padx=20,
+            pady=5
+        )
+        close_btn.pack(pady=(0, 20))
+        
+        return dialog
+        
+    def _rebuild_event_index(self):
+        """Collect the event days for the displayed month"""
+        self._event_days_this_month = {
+            d for (y, m, d) in self.mock_events
+            if y == self.current_year and m == self.current_month
+        }
+        
+    def _schedule_redraw(self):
+        """Redraw the calendar shortly, dropping any redraw still pending"""
+        # The label updates right away so clicks get immediate feedback
+        self.update_month_label()
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+        self._redraw_job = self.after(30, self._do_redraw)
+        
+    def _do_redraw(self):
+        """Redraw the calendar for the month the user ended up on"""
+        self._redraw_job = None
+        self._rebuild_event_index()
+        self.update_calendar_display()
+        
     def previous_month(self):
         """Go to previous month"""
         if self.current_month == 1:
@@ -203,7 +324,7 @@ class CalendarWidget(BaseWidget):
             self.current_year -= 1
         else:
             self.current_month -= 1
-        self.update_calendar_display()
+        self._schedule_redraw()
         
     def next_month(self):
         """Go to next month"""
@@ -212,10 +333,16 @@ class CalendarWidget(BaseWidget):
             self.current_year += 1
         else:
             self.current_month += 1
-        self.update_calendar_display()
+        self._schedule_redraw()
         
     def refresh(self):
         """Refresh calendar data (for future API integration)"""
+        if not self._content_ready:
+            return
+        
         # In the future, this will fetch data from Google Calendar API
+        # Replaced event data may use plain strings again, so normalize before use
+        self.mock_events = self._normalize_events(self.mock_events)
+        self._rebuild_event_index()
         self.update_calendar_display()
         self.update_events_list()
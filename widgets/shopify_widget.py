@@ -5,12 +5,20 @@ Designed for easy Shopify API integration
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import datetime
+from tkinter import ttk
+from collections import Counter
 from .base_widget import BaseWidget
 
 
 class ShopifyWidget(BaseWidget):
+    STATUS_COLORS = {
+        'Pending': '#f39c12',
+        'Processing': '#3498db',
+        'Shipped': '#9b59b6',
+        'Fulfilled': '#27ae60',
+        'Cancelled': '#e74c3c'
+    }
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, title="🛍️ Shopify Orders", **kwargs)
         
@@ -59,6 +67,7 @@ class ShopifyWidget(BaseWidget):
                 'items': 1
             }
         ]
+        self._ingest_orders()
         
         # Create orders display
         self.create_orders_display()
@@ -66,6 +75,12 @@ class ShopifyWidget(BaseWidget):
         # Create summary stats
         self.create_summary_stats()
         
+    def _ingest_orders(self):
+        """Parse order amounts to cents and count statuses once per data load"""
+        for order in self.mock_orders:
+            order['amount_cents'] = int(round(float(order['amount'].replace('$', '')) * 100))
+        self._status_counts = Counter(order['status'] for order in self.mock_orders)
+        
     def create_orders_display(self):
         """Create the orders list display"""
         # Header
@@ -74,7 +89,7 @@ class ShopifyWidget(BaseWidget):
             text="Recent Orders:",
             bg='#34495e',
             fg='white',
-            font=('Arial', 11, 'bold'),
+            font='sm.bold11',
             anchor='w'
         )
         orders_header.pack(fill='x', pady=(0, 10))
@@ -83,106 +98,61 @@ class ShopifyWidget(BaseWidget):
         self.orders_frame = tk.Frame(self.content_frame, bg='#34495e')
         self.orders_frame.pack(fill='both', expand=True)
         
+        # Orders table
+        columns = (
+            ('order_id', "Order", 70),
+            ('customer', "Customer", 140),
+            ('amount', "Amount", 80),
+            ('status', "Status", 90),
+            ('date', "Date", 90),
+            ('items', "Items", 50)
+        )
+        self.orders_tv = ttk.Treeview(
+            self.orders_frame,
+            columns=[column for column, _, _ in columns],
+            show='headings',
+            style=self.TREEVIEW_STYLE,
+            height=len(self.mock_orders),
+            selectmode='none'
+        )
+        for column, heading, width in columns:
+            self.orders_tv.heading(column, text=heading, anchor='w')
+            self.orders_tv.column(column, width=width, anchor='w')
+        self.orders_tv.pack(fill='both', expand=True, padx=5)
+        
+        # Status colors are applied through row tags, configured as statuses show up
+        self._status_tags = set()
+        
         # Create order entries
         self.create_order_entries()
         
     def create_order_entries(self):
-        """Create individual order entry widgets"""
-        for i, order in enumerate(self.mock_orders):
-            # Order container
-            order_frame = tk.Frame(self.orders_frame, bg='#2c3e50', relief='flat', borderwidth=1)
-            order_frame.pack(fill='x', pady=2, padx=5)
-            
-            # Order header
-            header_frame = tk.Frame(order_frame, bg='#2c3e50')
-            header_frame.pack(fill='x', padx=10, pady=5)
-            
-            # Order ID
-            order_id_label = tk.Label(
-                header_frame,
-                text=order['order_id'],
-                bg='#2c3e50',
-                fg='#3498db',
-                font=('Arial', 10, 'bold')
-            )
-            order_id_label.pack(side='left')
-            
-            # Status badge
-            status_color = self.get_status_color(order['status'])
-            status_label = tk.Label(
-                header_frame,
-                text=order['status'],
-                bg=status_color,
-                fg='white',
-                font=('Arial', 8, 'bold'),
-                padx=8,
-                pady=2
-            )
-            status_label.pack(side='right')
-            
-            # Order details
-            details_frame = tk.Frame(order_frame, bg='#2c3e50')
-            details_frame.pack(fill='x', padx=10, pady=(0, 5))
-            
-            # Customer name
-            customer_label = tk.Label(
-                details_frame,
-                text=order['customer'],
-                bg='#2c3e50',
-                fg='white',
-                font=('Arial', 11, 'bold')
+        """Insert a table row for each order"""
+        for order in self.mock_orders:
+            self.orders_tv.insert(
+                '',
+                'end',
+                values=(
+                    order['order_id'],
+                    order['customer'],
+                    order['amount'],
+                    order['status'],
+                    order['date'],
+                    order['items']
+                ),
+                tags=(self._status_tag(order['status']),)
             )
-            customer_label.pack(side='left')
-            
-            # Amount
-            amount_label = tk.Label(
-                details_frame,
-                text=order['amount'],
-                bg='#2c3e50',
-                fg='#27ae60',
-                font=('Arial', 11, 'bold')
-            )
-            amount_label.pack(side='right')
-            
-            # Additional info
-            info_frame = tk.Frame(order_frame, bg='#2c3e50')
-            info_frame.pack(fill='x', padx=10, pady=(0, 5))
             
-            # Date
-            date_label = tk.Label(
-                info_frame,
-                text=f"Date: {order['date']}",
-                bg='#2c3e50',
-                fg='#95a5a6',
-                font=('Arial', 9)
-            )
-            date_label.pack(side='left')
-            
-            # Items count
-            items_label = tk.Label(
-                info_frame,
-                text=f"Items: {order['items']}",
-                bg='#2c3e50',
-                fg='#95a5a6',
-                font=('Arial', 9)
-            )
-            items_label.pack(side='right')
-            
-            # Separator
-            if i < len(self.mock_orders) - 1:
-                separator = tk.Frame(order_frame, height=1, bg='#34495e')
-                separator.pack(fill='x', pady=5)
-                
+    def _status_tag(self, status):
+        """Return the row tag for a status, configuring its color on first use"""
+        if status not in self._status_tags:
+            self.orders_tv.tag_configure(status, background=self.get_status_color(status), foreground='white')
+            self._status_tags.add(status)
+        return status
+        
     def get_status_color(self, status):
         """Get color for order status"""
-        status_colors = {
-            'Pending': '#f39c12',
-            'Processing': '#3498db',
-            'Shipped': '#9b59b6',
-            'Fulfilled': '#27ae60',
-            'Cancelled': '#e74c3c'
-        }
-        return status_colors.get(status, '#95a5a6')
+        return self.STATUS_COLORS.get(status, '#95a5a6')
         
     def create_summary_stats(self):
         """Create summary statistics display"""
@@ -192,7 +162,7 @@ class ShopifyWidget(BaseWidget):
             text="Store Summary:",
             bg='#34495e',
             fg='white',
-            font=('Arial', 11, 'bold'),
+            font='sm.bold11',
             anchor='w'
         )
         stats_header.pack(fill='x', pady=(15, 10))
@@ -201,28 +171,23 @@ class ShopifyWidget(BaseWidget):
         stats_frame = tk.Frame(self.content_frame, bg='#2c3e50')
         stats_frame.pack(fill='x', padx=5, pady=(0, 10))
         
-        # Calculate mock stats
-        total_orders = len(self.mock_orders)
-        total_revenue = sum(float(order['amount'].replace('$', '')) for order in self.mock_orders)
-        pending_orders = len([order for order in self.mock_orders if order['status'] == 'Pending'])
-        fulfilled_orders = len([order for order in self.mock_orders if order['status'] == 'Fulfilled'])
-        
-        stats_data = [
-            ("Total Orders", str(total_orders)),
-            ("Total Revenue", f"${total_revenue:.2f}"),
-            ("Pending", str(pending_orders)),
-            ("Fulfilled", str(fulfilled_orders))
-        ]
+        # One StringVar per stat so refreshes only change label text
+        self.stats_vars = {
+            "Total Orders": tk.StringVar(self),
+            "Total Revenue": tk.StringVar(self),
+            "Pending": tk.StringVar(self),
+            "Fulfilled": tk.StringVar(self)
+        }
         
         # Create stats grid
-        for i, (stat, value) in enumerate(stats_data):
+        for i, (stat, value_var) in enumerate(self.stats_vars.items()):
             # Stat label
             stat_label = tk.Label(
                 stats_frame,
                 text=stat,
                 bg='#2c3e50',
                 fg='#95a5a6',
-                font=('Arial', 9),
+                font='sm.normal9',
                 anchor='w'
             )
             stat_label.grid(row=i, column=0, sticky='w', padx=10, pady=3)
@@ -230,10 +195,10 @@ class ShopifyWidget(BaseWidget):
             # Value label
             value_label = tk.Label(
                 stats_frame,
-                text=value,
+                textvariable=value_var,
                 bg='#2c3e50',
                 fg='white',
-                font=('Arial', 9, 'bold'),
+                font='sm.bold9',
                 anchor='w'
             )
             value_label.grid(row=i, column=1, sticky='w', padx=(20, 10), pady=3)
@@ -242,16 +207,30 @@ class ShopifyWidget(BaseWidget):
         stats_frame.grid_columnconfigure(0, weight=1)
         stats_frame.grid_columnconfigure(1, weight=1)
         
+        self._recompute_stats()
+        
+    def _recompute_stats(self):
+        """Update the summary stat values from the current orders"""
+        total_revenue_cents = sum(order['amount_cents'] for order in self.mock_orders)
+        sign = '-' if total_revenue_cents < 0 else ''
+        dollars, cents = divmod(abs(total_revenue_cents), 100)
+        
+        self.stats_vars["Total Orders"].set(str(len(self.mock_orders)))
+        self.stats_vars["Total Revenue"].set(f"{sign}${dollars}.{cents:02d}")
+        self.stats_vars["Pending"].set(str(self._status_counts['Pending']))
+        self.stats_vars["Fulfilled"].set(str(self._status_counts['Fulfilled']))
+        
     def refresh(self):
         """Refresh order data (for future API integration)"""
+        if not self._content_ready:
+            return
+        
         # In the future, this will fetch data from Shopify API
+        self._ingest_orders()
+        
         # Clear and recreate order entries
-        for widget in self.orders_frame.winfo_children():
-            widget.destroy()
+        self.orders_tv.delete(*self.orders_tv.get_children())
         self.create_order_entries()
         
-        # Update summary stats
-        for widget in self.content_frame.winfo_children():
-            if hasattr(widget, 'winfo_name') and 'stats_frame' in str(widget):
-                widget.destroy()
-        self.create_summary_stats()
+        # Update summary stats in place
+        self._recompute_stats()
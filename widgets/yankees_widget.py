@@ -5,12 +5,16 @@ Designed for easy sports API integration
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import datetime
+from tkinter import ttk
 from .base_widget import BaseWidget
 
 
 class YankeesWidget(BaseWidget):
+    STATUS_COLORS = {
+        'Final': '#e74c3c',
+        'Upcoming': '#27ae60'
+    }
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, title="⚾ Yankees Games", **kwargs)
         
@@ -52,6 +56,14 @@ class YankeesWidget(BaseWidget):
             }
         ]
         
+        # Mock stats (replace with real API data)
+        self.mock_team_stats = {
+            "Record": "87-75",
+            "Games Back": "12.5",
+            "Last 10": "6-4",
+            "Streak": "W2"
+        }
+        
         # Create game display
         self.create_games_display()
         
@@ -66,7 +78,7 @@ class YankeesWidget(BaseWidget):
             text="Recent & Upcoming Games:",
             bg='#34495e',
             fg='white',
-            font=('Arial', 11, 'bold'),
+            font='sm.bold11',
             anchor='w'
         )
         games_header.pack(fill='x', pady=(0, 10))
@@ -75,95 +87,58 @@ class YankeesWidget(BaseWidget):
         self.games_frame = tk.Frame(self.content_frame, bg='#34495e')
         self.games_frame.pack(fill='both', expand=True)
         
+        # Games table
+        columns = (
+            ('date', "Date", 90),
+            ('opponent', "Opponent", 150),
+            ('time', "Time", 70),
+            ('venue', "Venue", 120),
+            ('status', "Status", 80),
+            ('score', "Score", 160)
+        )
+        self.games_tv = ttk.Treeview(
+            self.games_frame,
+            columns=[column for column, _, _ in columns],
+            show='headings',
+            style=self.TREEVIEW_STYLE,
+            height=len(self.mock_games),
+            selectmode='none'
+        )
+        for column, heading, width in columns:
+            self.games_tv.heading(column, text=heading, anchor='w')
+            self.games_tv.column(column, width=width, anchor='w')
+        self.games_tv.pack(fill='both', expand=True, padx=5)
+        
+        # Status colors are applied through row tags; anything not Final uses the Upcoming color
+        for status, color in self.STATUS_COLORS.items():
+            self.games_tv.tag_configure(status, background=color, foreground='white')
+        
         # Create game entries
         self.create_game_entries()
         
     def create_game_entries(self):
-        """Create individual game entry widgets"""
-        for i, game in enumerate(self.mock_games):
-            # Game container
-            game_frame = tk.Frame(self.games_frame, bg='#2c3e50', relief='flat', borderwidth=1)
-            game_frame.pack(fill='x', pady=2, padx=5)
-            
-            # Date and status
-            info_frame = tk.Frame(game_frame, bg='#2c3e50')
-            info_frame.pack(fill='x', padx=10, pady=5)
-            
-            # Date
-            date_label = tk.Label(
-                info_frame,
-                text=game['date'],
-                bg='#2c3e50',
-                fg='#95a5a6',
-                font=('Arial', 9)
-            )
-            date_label.pack(side='left')
-            
-            # Status badge
-            status_color = '#e74c3c' if game['status'] == 'Final' else '#27ae60'
-            status_label = tk.Label(
-                info_frame,
-                text=game['status'],
-                bg=status_color,
-                fg='white',
-                font=('Arial', 8, 'bold'),
-                padx=8,
-                pady=2
-            )
-            status_label.pack(side='right')
-            
-            # Game details
-            details_frame = tk.Frame(game_frame, bg='#2c3e50')
-            details_frame.pack(fill='x', padx=10, pady=(0, 5))
-            
-            # Opponent
-            opponent_label = tk.Label(
-                details_frame,
-                text=f"vs {game['opponent']}",
-                bg='#2c3e50',
-                fg='white',
-                font=('Arial', 12, 'bold')
-            )
-            opponent_label.pack(side='left')
-            
-            # Time
-            time_label = tk.Label(
-                details_frame,
-                text=game['time'],
-                bg='#2c3e50',
-                fg='#3498db',
-                font=('Arial', 10)
-            )
-            time_label.pack(side='right')
+        """Fill the games table, reusing existing rows where possible"""
+        rows = list(self.games_tv.get_children())
+        
+        # Drop rows beyond the current number of games
+        if len(rows) > len(self.mock_games):
+            self.games_tv.delete(*rows[len(self.mock_games):])
             
-            # Venue
-            venue_label = tk.Label(
-                game_frame,
-                text=game['venue'],
-                bg='#2c3e50',
-                fg='#95a5a6',
-                font=('Arial', 9),
-                anchor='w'
+        for i, game in enumerate(self.mock_games):
+            values = (
+                game['date'],
+                f"vs {game['opponent']}",
+                game['time'],
+                game['venue'],
+                game['status'],
+                game['score'] or ""
             )
-            venue_label.pack(fill='x', padx=10, pady=(0, 5))
+            tag = 'Final' if game['status'] == 'Final' else 'Upcoming'
+            if i < len(rows):
+                self.games_tv.item(rows[i], values=values, tags=(tag,))
+            else:
+                self.games_tv.insert('', 'end', values=values, tags=(tag,))
             
-            # Score (if game is final)
-            if game['score']:
-                score_label = tk.Label(
-                    game_frame,
-                    text=game['score'],
-                    bg='#2c3e50',
-                    fg='#f39c12',
-                    font=('Arial', 11, 'bold'),
-                    anchor='w'
-                )
-                score_label.pack(fill='x', padx=10, pady=(0, 5))
-            
-            # Separator
-            if i < len(self.mock_games) - 1:
-                separator = tk.Frame(game_frame, height=1, bg='#34495e')
-                separator.pack(fill='x', pady=5)
-                
     def create_team_stats(self):
         """Create team statistics display"""
         # Stats header
@@ -172,7 +147,7 @@ class YankeesWidget(BaseWidget):
             text="Team Stats:",
             bg='#34495e',
             fg='white',
-            font=('Arial', 11, 'bold'),
+            font='sm.bold11',
             anchor='w'
         )
         stats_header.pack(fill='x', pady=(15, 10))
@@ -181,23 +156,23 @@ class YankeesWidget(BaseWidget):
         stats_frame = tk.Frame(self.content_frame, bg='#2c3e50')
         stats_frame.pack(fill='x', padx=5, pady=(0, 10))
         
-        # Mock stats (replace with real API data)
-        stats_data = [
-            ("Record", "87-75"),
-            ("Games Back", "12.5"),
-            ("Last 10", "6-4"),
-            ("Streak", "W2")
-        ]
+        # One StringVar per stat so refreshes only change label text
+        self.team_stats_vars = {
+            "Record": tk.StringVar(self),
+            "Games Back": tk.StringVar(self),
+            "Last 10": tk.StringVar(self),
+            "Streak": tk.StringVar(self)
+        }
         
         # Create stats grid
-        for i, (stat, value) in enumerate(stats_data):
+        for i, (stat, value_var) in enumerate(self.team_stats_vars.items()):
             # Stat label
             stat_label = tk.Label(
                 stats_frame,
                 text=stat,
                 bg='#2c3e50',
                 fg='#95a5a6',
-                font=('Arial', 9),
+                font='sm.normal9',
                 anchor='w'
             )
             stat_label.grid(row=i, column=0, sticky='w', padx=10, pady=3)
@@ -205,10 +180,10 @@ class YankeesWidget(BaseWidget):
             # Value label
             value_label = tk.Label(
                 stats_frame,
-                text=value,
+                textvariable=value_var,
                 bg='#2c3e50',
                 fg='white',
-                font=('Arial', 9, 'bold'),
+                font='sm.bold9',
                 anchor='w'
             )
             value_label.grid(row=i, column=1, sticky='w', padx=(20, 10), pady=3)
@@ -217,10 +192,19 @@ class YankeesWidget(BaseWidget):
         stats_frame.grid_columnconfigure(0, weight=1)
         stats_frame.grid_columnconfigure(1, weight=1)
         
+        self._update_team_stats(self.mock_team_stats)
+        
+    def _update_team_stats(self, data):
+        """Set the team stat values from a {stat name: value} mapping"""
+        for stat, value in data.items():
+            self.team_stats_vars[stat].set(value)
+        
     def refresh(self):
         """Refresh game data (for future API integration)"""
+        if not self._content_ready:
+            return
+        
         # In the future, this will fetch data from sports API
-        # Clear and recreate game entries
-        for widget in self.games_frame.winfo_children():
-            widget.destroy()
+        # Update game rows and team stats in place
         self.create_game_entries()
+        self._update_team_stats(self.mock_team_stats)